@@ -2,14 +2,37 @@
 Main application
 """
 
+import copy
 from typing import List
 
 import streamlit as st
 
-from scraper.app import execute_scraping
+from scraper.app import execute_scraping, scrape_url
 from scraper.config import tasks
 from scraper.logging import setup_logging
 
+# Session state defaults, built once and reused on every rerun and refresh
+SESSION_DEFAULTS = {
+    "url": "",
+    "model_company_key": "OpenAI",
+    "model_name_key": "gpt-4o-mini",
+    "chatbot_api_key": "",
+    "source_key": "URL",
+    "task_key": "Chat",
+    "temperature_key": 0.7,
+    "max_tokens_key": 1000,
+    "status": [],
+    "graph": None,
+    "chat_history": [],
+    "scraping_done": False,
+    "question_input": "",
+    "summary_result": "",
+    "key_points_result": "",
+    "refresh_triggered": False,
+    "selected_task_index": 0,
+    "error_mes": "",
+}
+
 
 def main():
     """Main function to set up the Streamlit interface and session state."""
@@ -95,8 +118,8 @@ def display_scraping_ui() -> None:
     if st.session_state.error_mes:
         st.error(f"{st.session_state.error_mes}")
 
-    # Layout for start and refresh buttons
-    start_col, refresh_col = st.columns([1, 1], gap="small")
+    # Layout for start, refresh and clear cache buttons
+    start_col, refresh_col, clear_col = st.columns([1, 1, 1], gap="small")
 
     with start_col:
         st.button(
@@ -109,6 +132,14 @@ def display_scraping_ui() -> None:
     with refresh_col:
         st.button("Refresh", key="refresh_button", on_click=trigger_refresh)
 
+    with clear_col:
+        st.button(
+            "Clear cache",
+            key="clear_cache_button",
+            on_click=clear_cached_pages,
+            help="Fetch pages again instead of reusing recently scraped results.",
+        )
+
 
 def display_file_uploader(allowed_extensions: List[str]):
     """Display file uploader for parsing files."""
@@ -221,13 +252,15 @@ def handle_submit(user_input: str):
         st.session_state.chat_history.append(("assistant", answer))
         st.session_state.chat_history.append(("user", user_input))
 
-        # Reverse the list to display the latest message first
+        # Reverse the list to display the latest message first, sent as one element
         reversed_chat_history = reversed(st.session_state.chat_history)
-        for role, content in reversed_chat_history:
-            st.markdown(
-                f"<div class='chat-message-{role}'>{content}</div>",
-                unsafe_allow_html=True,
-            )
+        st.markdown(
+            "".join(
+                f"<div class='chat-message-{role}'>{content}</div>"
+                for role, content in reversed_chat_history
+            ),
+            unsafe_allow_html=True,
+        )
         st.markdown(" ")
 
 
@@ -269,6 +302,11 @@ def handle_keypoints_submit():
         )
 
 
+def clear_cached_pages() -> None:
+    """Drops the cached scrape results so the next Start fetches the page again."""
+    scrape_url.clear()
+
+
 def trigger_refresh() -> None:
     """Triggers a refresh by setting the flag."""
     st.session_state.refresh_triggered = True
@@ -277,54 +315,19 @@ def trigger_refresh() -> None:
 
 def initialize_session_state() -> None:
     """Initialize session state variables if not already set."""
-    session_defaults = {
-        "url": "",
-        "model_company_key": "OpenAI",
-        "model_name_key": "gpt-4o-mini",
-        "chatbot_api_key": "",
-        "source_key": "URL",
-        "task_key": "Chat",
-        "temperature_key": 0.7,
-        "max_tokens_key": 1000,
-        "status": [],
-        "graph": None,
-        "chat_history": [],
-        "scraping_done": False,
-        "question_input": "",
-        "summary_result": "",
-        "key_points_result": "",
-        "refresh_triggered": False,
-        "selected_task_index": 0,
-        "error_mes": "",
-    }
-    for key, value in session_defaults.items():
+    for key, value in SESSION_DEFAULTS.items():
         if key not in st.session_state:
-            st.session_state[key] = value
+            # Copy so mutable defaults like chat_history are not shared
+            st.session_state[key] = copy.copy(value)
 
 
 def clear_state() -> None:
     """Clears the session state."""
     for key in list(st.session_state.keys()):
         del st.session_state[key]
-    st.session_state.status = []
+    initialize_session_state()
     st.session_state.url_input = ""
-    st.session_state.question_input = ""
-    st.session_state.chat_history = []
-    st.session_state.model_company_key = "OpenAI"
-    st.session_state.model_name_key = "gpt-4o-mini"
-    st.session_state.chatbot_api_key = ""
-    st.session_state.source_key = "URL"
-    st.session_state.task_key = "Chat"
-    st.session_state.temperature_key = 0.7
-    st.session_state.max_tokens_key = 1000
-    st.session_state.selected_task_index = 0
-    st.session_state.key_points_result = ""
-    st.session_state.summary_result = ""
-    st.session_state.scraping_done = False
     st.session_state.qa = (None,)
-    st.cache_data.clear()
-    st.session_state.refresh_triggered = False
-    st.session_state.error_mes = ""
     st.rerun()
 
 
@@ -6,6 +6,8 @@ import logging
 from pathlib import Path
 from typing import List
 
+import streamlit as st
+
 from scraper.errors import PageScrapingError
 from scraper.graphs import QAGraph
 from scraper.graphs.base_graph import GraphInterface
@@ -13,12 +15,17 @@ from scraper.graphs.graph_factory import GraphFactory
 from scraper.models import configure_llm, create_models
 from scraper.utils import (
     check_robots,
+    deduplicate_documents,
     get_scraper,
     install_playwright_chromium,
+    is_asset_url,
     is_valid_url,
     url_exists,
 )
 
+# Seconds a scraped URL's documents are reused before the page is fetched again
+SCRAPE_CACHE_TTL = 900
+
 
 def validate_input(session_state) -> bool:
     """Validate user inputs and set error message if invalid."""
@@ -37,6 +44,10 @@ def validate_input(session_state) -> bool:
         if not is_valid_url(source):
             set_error("Invalid URL format.", session_state)
             return False
+        # Rejected before any network call, there is no text to scrape in these files
+        if is_asset_url(source):
+            set_error("The URL points to an image, style or media file.", session_state)
+            return False
         if not url_exists(source):
             set_error("The URL does not exist.", session_state)
             return False
@@ -93,15 +104,36 @@ def scrape(session_state: dict) -> List[str]:
         source = str(save_uploaded_file(uploaded_file))
         logging.info(f"File saved at: {source}")
 
+    # Web pages are cached so a repeated Start on the same URL skips the crawl
+    if selected_source.is_url:
+        return scrape_url(selected_source.id, source)
+    return scrape_source(selected_source.id, source)
+
+
+@st.cache_data(ttl=SCRAPE_CACHE_TTL, show_spinner=False)
+def scrape_url(source_id: int, url: str) -> List[str]:
+    """Scrapes a URL, reusing the documents of a recent scrape of the same URL."""
+    return scrape_source(source_id, url)
+
+
+def scrape_source(source_id: int, source: str) -> List[str]:
+    """Runs the scraper for the source and removes duplicate documents."""
     # Use factory to get the appropriate scraper
-    scraper = get_scraper(selected_source.id, source)
+    scraper = get_scraper(source_id, source)
 
     documents = scraper.scrape()
     if not documents:
         logging.error("Scraper returned None for documents")
         raise PageScrapingError("Failed to scrape documents")
 
-    return documents
+    # Repeated content would only add embedding and LLM cost downstream
+    unique_documents = deduplicate_documents(documents)
+    if len(unique_documents) < len(documents):
+        logging.info(
+            f"Dropped {len(documents) - len(unique_documents)} duplicate documents"
+        )
+
+    return unique_documents
 
 
 def process_and_update_state(graph: GraphInterface, session_state: dict) -> None:
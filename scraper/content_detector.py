@@ -1,6 +1,12 @@
 import re
 from typing import Optional
 
+# Detection patterns are compiled once at import time
+HTML_PATTERN = re.compile(r"<html|<!DOCTYPE html>", re.IGNORECASE)
+MARKDOWN_PATTERN = re.compile(r"^\s*(\#|\*|\-|\+|\d+\.)\s", re.MULTILINE)
+JSON_PATTERN = re.compile(r"^\s*\{.*\}\s*$", re.DOTALL)
+XML_PATTERN = re.compile(r"<\?xml|<\w+\s*[^>]*>")
+
 
 class ContentDetector:
     """Base class for content format detection."""
@@ -13,28 +19,28 @@ class ContentDetector:
 
 class HTMLDetector(ContentDetector):
     def detect(self, content: str) -> str:
-        if re.search(r"<html|<!DOCTYPE html>", content, re.IGNORECASE):
+        if HTML_PATTERN.search(content):
             return "HTML"
         return ""
 
 
 class MarkdownDetector(ContentDetector):
     def detect(self, content: str) -> str:
-        if re.search(r"^\s*(\#|\*|\-|\+|\d+\.)\s", content, re.MULTILINE):
+        if MARKDOWN_PATTERN.search(content):
             return "Markdown"
         return ""
 
 
 class JSONDetector(ContentDetector):
     def detect(self, content: str) -> str:
-        if re.match(r"^\s*\{.*\}\s*$", content, re.DOTALL):
+        if JSON_PATTERN.match(content):
             return "JSON"
         return ""
 
 
 class XMLDetector(ContentDetector):
     def detect(self, content: str) -> str:
-        if re.search(r"<\?xml|<\w+\s*[^>]*>", content):
+        if XML_PATTERN.search(content):
             return "XML"
         return ""
 
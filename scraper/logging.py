@@ -4,14 +4,17 @@ Logging configuration for the application.
 
 import logging
 import traceback
+from functools import lru_cache
 
 
+@lru_cache(maxsize=1)
 def setup_logging():
     """
     Sets up logging configuration for the application.
 
     Configures the logging to display the timestamp, log level, and message.
     Sets the logging level for specific external packages to WARNING or higher.
+    The result is cached so Streamlit reruns do not configure logging again.
     """
     logging.basicConfig(
         level=logging.INFO,  # Set the default logging level to INFO.
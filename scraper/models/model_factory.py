@@ -1,12 +1,14 @@
 from collections import namedtuple
+from functools import lru_cache
 from typing import Dict, Optional, Type
 
+from langchain.embeddings import CacheBackedEmbeddings
 from langchain.embeddings.base import Embeddings
+from langchain.storage import InMemoryByteStore
 from langchain_huggingface import HuggingFaceEndpoint
 from langchain_openai import OpenAIEmbeddings
 from pydantic import BaseModel, Field
 from scrapegraphai.models import OpenAI
-from sentence_transformers import SentenceTransformer
 
 ModelConfig = namedtuple("ModelConfig", ["llm", "embedder"])
 
@@ -63,7 +65,14 @@ class LLMConfig(BaseModel):
 def create_models(company_name: str, config: dict) -> ModelConfig:
     factory = factory_map[company_name]()
     llm = factory.create_llm(config)
-    embedder = factory.create_embedder(config)
+    underlying_embedder = factory.create_embedder(config)
+    # The store belongs to this session's graph, so re-ranking retrieved chunks
+    # reuses their vectors and the memory is freed with the session
+    embedder = CacheBackedEmbeddings.from_bytes_store(
+        underlying_embedder,
+        InMemoryByteStore(),
+        namespace=underlying_embedder.model,
+    )
 
     return ModelConfig(llm=llm, embedder=embedder)
 
@@ -78,12 +87,31 @@ def configure_llm(session_state: dict) -> LLMConfig:
     )
 
 
+@lru_cache(maxsize=None)
+def load_sentence_transformer(model_name: str):
+    """Loads a sentence transformer model once per process and reuses it."""
+    # Imported here so torch is only loaded when the Hugging Face embedder is used
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    model = SentenceTransformer(model_name)
+    if torch.cuda.is_available():
+        # Half precision halves the memory traffic of encoding on the GPU
+        model = model.half()
+    return model
+
+
 class SentenceTransformerEmbeddings(Embeddings):
     def __init__(self, model_name="all-MiniLM-L6-v2"):
-        self.model = SentenceTransformer(model_name)
+        self.model = model_name
+        self.client = load_sentence_transformer(model_name)
 
     def embed_documents(self, texts):
-        return self.model.encode(texts, convert_to_tensor=False).tolist()
+        return self.client.encode(
+            texts, convert_to_tensor=False, normalize_embeddings=True
+        ).tolist()
 
     def embed_query(self, query):
-        return self.model.encode([query], convert_to_tensor=False)[0].tolist()
+        return self.client.encode(
+            [query], convert_to_tensor=False, normalize_embeddings=True
+        )[0].tolist()
@@ -71,11 +71,9 @@ class EbookNode(BaseNode):
             parsed = parser.from_file(source)
             content = parsed["content"]
 
-            # Split content into chunk-sized slices and store in a list
+            # Split content into chunk-sized slices, these are the final documents
             compressed_document = [
-                content[i : i + chunk_size]
-                for i in range(0, len(content), chunk_size)
-                if content[i : i + chunk_size]
+                content[i : i + chunk_size] for i in range(0, len(content), chunk_size)
             ]
             state.update({self.output[0]: compressed_document})
             return state
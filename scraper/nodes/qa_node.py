@@ -13,6 +13,7 @@ from langchain.retrievers.document_compressors import (
 )
 from langchain_community.document_transformers import EmbeddingsRedundantFilter
 from langchain_community.vectorstores import FAISS
+from langchain_community.vectorstores.utils import DistanceStrategy
 from scrapegraphai.nodes import BaseNode
 
 
@@ -49,6 +50,9 @@ class QuestionAnswer(BaseNode):
         self.verbose = (
             False if node_config is None else node_config.get("verbose", False)
         )
+        # The vector index is built once per document set and reused for every question
+        self.index: Optional[FAISS] = None
+        self.indexed_chunks: Optional[tuple] = None
 
     def execute(self, state: dict) -> dict:
         """
@@ -78,28 +82,36 @@ class QuestionAnswer(BaseNode):
         user_prompt = input_data[0]
         doc = input_data[1]
 
-        chunked_docs = []
-
-        for i, chunk in enumerate(doc):
-            doc = Document(
-                page_content=chunk,
-                metadata={
-                    "chunk": i + 1,
-                },
-            )
-            chunked_docs.append(doc)
-
-        logging.info("Updated chunks metadata")
-
         # Check if embedder_model is provided, if not use llm_model
         self.embedder_model = (
             self.embedder_model if self.embedder_model else self.llm_model
         )
         embeddings = self.embedder_model
 
-        index = FAISS.from_documents(chunked_docs, embeddings)
+        chunks = tuple(doc)
+        if self.index is None or chunks != self.indexed_chunks:
+            chunked_docs = []
+
+            for i, chunk in enumerate(chunks):
+                doc = Document(
+                    page_content=chunk,
+                    metadata={
+                        "chunk": i + 1,
+                    },
+                )
+                chunked_docs.append(doc)
+
+            logging.info("Updated chunks metadata")
+
+            # Embeddings are unit length, so inner product ranks like cosine similarity
+            self.index = FAISS.from_documents(
+                chunked_docs,
+                embeddings,
+                distance_strategy=DistanceStrategy.MAX_INNER_PRODUCT,
+            )
+            self.indexed_chunks = chunks
 
-        retriever = index.as_retriever()
+        retriever = self.index.as_retriever()
 
         redundant_filter = EmbeddingsRedundantFilter(embeddings=embeddings)
         # similarity_threshold could be set, now k=20
@@ -6,7 +6,6 @@ import logging
 from typing import List
 
 from scrapegraphai.graphs import BaseGraph
-from scrapegraphai.nodes import ParseNode
 
 from scraper.nodes import EbookNode
 from scraper.scrapers.scraper import Scraper
@@ -31,15 +30,9 @@ class EbookScraper(Scraper):
             },
         )
 
-        self.parse_node = ParseNode(
-            input="doc",
-            output=["parsed_doc"],
-            node_config={"parse_html": False, "chunk_size": 4096},
-        )
-
         self.graph = BaseGraph(
-            nodes=[self.ebook_node, self.parse_node],
-            edges=[(self.ebook_node, self.parse_node)],
+            nodes=[self.ebook_node],
+            edges=[],
             entry_point=self.ebook_node,
         )
 
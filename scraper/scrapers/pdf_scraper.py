@@ -6,7 +6,7 @@ import logging
 from typing import List
 
 from scrapegraphai.graphs import BaseGraph
-from scrapegraphai.nodes import FetchNode, ParseNode
+from scrapegraphai.nodes import FetchNode
 
 from scraper.scrapers.scraper import Scraper
 
@@ -30,15 +30,9 @@ class PdfScraper(Scraper):
             },
         )
 
-        self.parse_node = ParseNode(
-            input="doc",
-            output=["parsed_doc"],
-            node_config={"parse_html": False, "chunk_size": 4096},
-        )
-
         self.graph = BaseGraph(
-            nodes=[self.fetch_node, self.parse_node],
-            edges=[(self.fetch_node, self.parse_node)],
+            nodes=[self.fetch_node],
+            edges=[],
             entry_point=self.fetch_node,
         )
 
@@ -3,13 +3,21 @@ Module to handle fetching and parsing robots.txt for web scraping permissions.
 """
 
 import logging
-from typing import Dict, List, Optional
+import re
+import time
+from functools import lru_cache
+from typing import Dict, List, Optional, Pattern, Tuple
 from urllib.parse import urlparse
 
 import requests
 
 from scraper.errors import RobotsTxtError
 from scraper.logging import safe_run
+from scraper.session import CONNECT_TIMEOUT, http_session
+
+
+# Seconds a parsed robots.txt is trusted before it is fetched again
+ROBOTS_TTL = 3600
 
 
 class RobotsTxtChecker:
@@ -17,17 +25,28 @@ class RobotsTxtChecker:
     Fetches and parses the robots.txt file for a given website to manage scraping permissions.
     """
 
-    def __init__(self, base_url: str, requester: Optional[requests.Session] = None):
+    def __init__(
+        self,
+        base_url: str,
+        requester: Optional[requests.Session] = None,
+        ttl: float = ROBOTS_TTL,
+    ):
         """
         Initializes the RobotsTxtChecker with the base URL and an optional requester session.
 
         Args:
             base_url (str): The base URL of the website.
             requester (Optional[requests.Session]): An optional requests session for making HTTP requests.
+                Defaults to the shared application session.
+            ttl (float): Seconds after which the parsed rules are fetched again.
         """
-        self.requester = requester or requests.Session()
+        self.requester = requester or http_session
         self.rules: Dict[str, List[str]] = {}
+        self.disallow_patterns: Dict[str, Pattern] = {}
+        self.decisions: Dict[Tuple[str, str], bool] = {}
         self.robots_url = self._create_robots_url(base_url)
+        self.ttl = ttl
+        self.fetched_at: Optional[float] = None
 
     def _create_robots_url(self, base_url: str) -> str:
         """
@@ -50,21 +69,22 @@ class RobotsTxtChecker:
         """
         Fetches and parses the robots.txt file.
         """
+        self.fetched_at = time.monotonic()
         try:
-            response = self.requester.get(self.robots_url)
+            response = self.requester.get(self.robots_url, timeout=(CONNECT_TIMEOUT, 5))
             response.raise_for_status()
             self._parse(response.text)
             logging.info("robots.txt fetched and parsed successfully.")
         except requests.RequestException as e:
             if e.response is not None and e.response.status_code == 404:
+                # A missing robots.txt means there are no rules
+                self._parse("")
                 logging.warning(
                     f"robots.txt not found at {self.robots_url}, proceeding without it."
                 )
             else:
                 logging.error(f"Failed to fetch robots.txt from {self.robots_url}: {e}")
                 raise RobotsTxtError(f"Error fetching robots.txt: {e}")
-        finally:
-            self.requester.close()
 
     @safe_run
     def is_allowed(self, path: str, user_agent: str = "*") -> bool:
@@ -78,14 +98,32 @@ class RobotsTxtChecker:
         Returns:
             bool: True if the path is allowed, False otherwise.
         """
-        disallow_paths = self.rules.get(user_agent, [])
-        for disallow_path in disallow_paths:
-            if path.startswith(disallow_path):
-                logging.info(
-                    f"Access to {path} disallowed for {user_agent} by robots.txt."
-                )
-                return False
-        return True
+        self._refresh_if_expired()
+        user_agent = user_agent.lower()
+        key = (user_agent, path)
+        allowed = self.decisions.get(key)
+        if allowed is None:
+            disallow_pattern = self.disallow_patterns.get(user_agent)
+            allowed = disallow_pattern is None or not disallow_pattern.match(path)
+            self.decisions[key] = allowed
+        if not allowed:
+            logging.info(f"Access to {path} disallowed for {user_agent} by robots.txt.")
+        return allowed
+
+    def _refresh_if_expired(self) -> None:
+        """
+        Fetches robots.txt again when the parsed rules are older than the TTL.
+        The previous rules are kept if the new fetch fails.
+        """
+        if (
+            self.fetched_at is not None
+            and time.monotonic() - self.fetched_at < self.ttl
+        ):
+            return
+        try:
+            self.fetch()
+        except RobotsTxtError as e:
+            logging.warning(f"Keeping previous robots.txt rules: {e}")
 
     def _parse(self, content: str) -> None:
         """
@@ -94,13 +132,41 @@ class RobotsTxtChecker:
         Args:
             content (str): The content of the robots.txt file.
         """
+        self.rules = {}
         current_user_agent = None
         for line in content.splitlines():
-            line = line.strip()
-            if line.startswith("User-agent:"):
-                current_user_agent = line.split(":")[1].strip()
+            # Field names are case-insensitive; values may contain further colons
+            field, _, value = line.partition(":")
+            field = field.strip().lower()
+            if field == "user-agent":
+                current_user_agent = value.strip().lower()
                 self.rules[current_user_agent] = []
-            elif line.startswith("Disallow:") and current_user_agent is not None:
-                disallow_path = line.split(":")[1].strip()
-                self.rules[current_user_agent].append(disallow_path)
+            elif field == "disallow" and current_user_agent is not None:
+                disallow_path = value.strip()
+                # An empty Disallow allows everything, so it adds no prefix
+                if disallow_path:
+                    self.rules[current_user_agent].append(disallow_path)
+        # One anchored alternation per user agent replaces the per-prefix loop
+        self.disallow_patterns = {
+            user_agent: re.compile("|".join(map(re.escape, paths)))
+            for user_agent, paths in self.rules.items()
+            if paths
+        }
+        self.decisions = {}
         logging.info("robots.txt rules parsed and stored.")
+
+
+@lru_cache(maxsize=128)
+def get_robots_checker(base_url: str) -> RobotsTxtChecker:
+    """
+    Returns a fetched RobotsTxtChecker for a website, reusing it for later calls on the same site.
+
+    Args:
+        base_url (str): The scheme and network location of the website.
+
+    Returns:
+        RobotsTxtChecker: The checker with the robots.txt rules already parsed.
+    """
+    robots_checker = RobotsTxtChecker(base_url)
+    robots_checker.fetch()
+    return robots_checker
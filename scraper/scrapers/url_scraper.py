@@ -10,6 +10,9 @@ from scrapegraphai.nodes import FetchNode, ParseNode
 
 from scraper.scrapers.scraper import Scraper
 
+# scrapegraphai's Chromium loader returns failed page loads as content with this prefix
+LOADER_ERROR_PREFIX = "Error: "
+
 
 class UrlScraper(Scraper):
     def __init__(self, source: str) -> None:
@@ -26,6 +29,8 @@ class UrlScraper(Scraper):
             node_config={
                 "verbose": True,
                 "headless": True,
+                # Only the HTML is needed, skip downloading and decoding images
+                "loader_kwargs": {"args": ["--blink-settings=imagesEnabled=false"]},
             },
         )
 
@@ -59,6 +64,11 @@ class UrlScraper(Scraper):
 
             # Get the parsed document from the result
             parsed_doc_list = result.get("parsed_doc", [])
+            # An empty result makes the caller raise, so the error is never cached
+            first_document = parsed_doc_list[0].strip() if parsed_doc_list else ""
+            if first_document.startswith(LOADER_ERROR_PREFIX):
+                logging.error(f"Page could not be loaded: {first_document}")
+                return []
             if parsed_doc_list:
                 logging.info(f"Document size: {len(parsed_doc_list)} documents.")
             else:
@@ -0,0 +1,31 @@
+"""
+Shared HTTP session for the direct HTTP calls made by the application.
+"""
+
+import http.cookiejar
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+USER_AGENT = "mole-scraper (+https://github.com/arkeodev/scraper)"
+
+# Seconds to wait for a connection, including the TLS handshake
+CONNECT_TIMEOUT = 3
+
+# A single session keeps connections alive between robots.txt and URL checks
+http_session = requests.Session()
+http_session.headers["User-Agent"] = USER_AGENT
+# The session is shared by every Streamlit user, so no cookies may be stored on it
+http_session.cookies.set_policy(http.cookiejar.DefaultCookiePolicy(allowed_domains=[]))
+
+# Keep enough pooled connections per host for concurrent Streamlit sessions.
+# Failed connects are retried twice and read errors once, which covers a dropped
+# keep-alive socket while a stalled host costs at most two read timeouts
+_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=64,
+    max_retries=Retry(total=2, connect=2, read=1, backoff_factor=0.3),
+)
+http_session.mount("https://", _adapter)
+http_session.mount("http://", _adapter)